@@ -12,7 +12,7 @@ import logging
 from typing import Any, Dict, List, Optional
 
 import ai_hybrid_app_import_sync as core
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from pydantic import BaseModel, Field
 
 logging.basicConfig(level=logging.INFO)
@@ -30,6 +30,7 @@ app = FastAPI(
         {"name": "import", "description": "Import endpoints for JSON data"},
         {"name": "search", "description": "Vector & hybrid search endpoints"},
         {"name": "ask", "description": "Chat/Ask endpoint using LLM & context"},
+        {"name": "coverage", "description": "Precomputed traceability coverage"},
     ],
 )
 
@@ -75,6 +76,27 @@ class AskResponse(BaseModel):
     query: str
     data_used: GraphNeighbourhood
     answer: str
+    cached: bool = False
+
+
+class AnswerCacheStats(BaseModel):
+    epoch: str
+    generation: int
+    size: int
+    max_size: int
+    threshold: float
+    hits: int
+    misses: int
+    evictions: int
+    hit_rate: float
+
+
+class CoverageResponse(BaseModel):
+    scope: str
+    total: int
+    skip: int
+    limit: int
+    items: List[Dict[str, Any]]
 
 
 # --- Endpoints ---
@@ -133,3 +155,29 @@ def ask_endpoint(q: SearchQuery):
         logger.error(f"Ask endpoint failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Ask failed: {e}")
     return resp
+
+
+@app.get("/ask/cache", tags=["ask"], response_model=AnswerCacheStats)
+def ask_cache_stats():
+    return core.answer_cache.stats()
+
+
+@app.get("/coverage", tags=["coverage"], response_model=CoverageResponse)
+def coverage(
+    scope: str = Query("requirement", description="requirement, reqdoc or customer"),
+    status: Optional[str] = Query(
+        None,
+        description="Requirement status: untested, not_run, passed, failed or other",
+    ),
+    without_pass: bool = Query(False, description="Requirements with no passing run"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=1000),
+):
+    try:
+        result = core.get_coverage(scope, status, without_pass, skip, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Coverage lookup failed: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Coverage lookup failed: {e}")
+    return result
@@ -14,11 +14,15 @@ graph+vector search, and contextual Q&A using LLMs.
 
 import json
 import logging
+import math
 import os
-from typing import Any, Dict, List
+import re
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import requests
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, HTTPException, Request
 from neo4j import GraphDatabase, Session
 from qdrant_client import QdrantClient
 from qdrant_client.models import Distance, PointStruct, VectorParams
@@ -35,6 +39,33 @@ OLLAMA_URL = os.getenv("OLLAMA_URL", "http://localhost:11434")
 EMBED_MODEL = os.getenv("EMBED_MODEL", "nomic-embed-text")
 CHAT_MODEL = os.getenv("CHAT_MODEL", "llama3")
 
+LINK_BATCH_SIZE = int(os.getenv("LINK_BATCH_SIZE", "1000"))
+# Opt-in: merge links whose endpoints have no constrained label using an
+# unindexed, label-less MATCH (scans all nodes per link)
+LINK_MATCH_UNLABELED = os.getenv("LINK_MATCH_UNLABELED", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+COVERAGE_BATCH_SIZE = int(os.getenv("COVERAGE_BATCH_SIZE", "500"))
+ANSWER_CACHE_SIZE = int(os.getenv("ANSWER_CACHE_SIZE", "256"))
+ANSWER_CACHE_THRESHOLD = float(os.getenv("ANSWER_CACHE_THRESHOLD", "0.95"))
+
+# TestRun property used to pick the latest run; runs without it rank after
+# dated runs, and the run id only breaks ties
+RUN_TIMESTAMP_FIELD = os.getenv("RUN_TIMESTAMP_FIELD", "executedAt")
+COVERAGE_PASS_STATUSES = [
+    x.strip().lower()
+    for x in os.getenv("COVERAGE_PASS_STATUSES", "passed,pass,ok,success").split(",")
+    if x.strip()
+]
+COVERAGE_FAIL_STATUSES = [
+    x.strip().lower()
+    for x in os.getenv("COVERAGE_FAIL_STATUSES", "failed,fail,error").split(",")
+    if x.strip()
+]
+
 CONSTRAINTS = [
     "CREATE CONSTRAINT requirement_id     IF NOT EXISTS FOR (n:Requirement)     REQUIRE n.id IS UNIQUE;",
     "CREATE CONSTRAINT doc_id             IF NOT EXISTS FOR (n:ReqDoc)          REQUIRE n.id IS UNIQUE;",
@@ -43,8 +74,29 @@ CONSTRAINTS = [
     "CREATE CONSTRAINT customer_id        IF NOT EXISTS FOR (n:Customer)        REQUIRE n.id IS UNIQUE;",
     "CREATE CONSTRAINT custreq_id         IF NOT EXISTS FOR (n:CustomerRequirement) REQUIRE n.id IS UNIQUE;",
     "CREATE CONSTRAINT srd_id             IF NOT EXISTS FOR (n:Srd)               REQUIRE n.id IS UNIQUE;",
+    "CREATE CONSTRAINT meta_id            IF NOT EXISTS FOR (n:Meta)            REQUIRE n.id IS UNIQUE;",
+    "CREATE INDEX requirement_coverage_status IF NOT EXISTS FOR (n:Requirement) ON (n.coverageStatus);",
+    "CREATE INDEX requirement_coverage_pass   IF NOT EXISTS FOR (n:Requirement) ON (n.coveragePassCount);",
 ]
 
+# Labels backed by a unique id constraint (and therefore an index)
+NODE_LABELS = (
+    "Requirement",
+    "ReqDoc",
+    "TestCase",
+    "TestRun",
+    "Customer",
+    "CustomerRequirement",
+    "Srd",
+)
+
+# Relationship types are interpolated into Cypher, so only plain identifiers
+REL_TYPE_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Derived per-requirement verification status stored in coverageStatus
+COVERAGE_STATUSES = ("untested", "not_run", "passed", "failed", "other")
+COVERAGE_SCOPES = ("requirement", "reqdoc", "customer")
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -57,6 +109,18 @@ def run_cypher(session: Session, query: str, params: Dict[str, Any] = None) -> N
     session.run(query, params or {})
 
 
+def remember_label(
+    label_index: Optional[Dict[Any, Set[str]]], node_id: Any, label: str
+) -> None:
+    # ids keep their raw JSON type, matching what is stored on the node
+    if label_index is not None and node_id:
+        label_index.setdefault(node_id, set()).add(label)
+
+
+def chunked(items: List[Any], size: int) -> List[List[Any]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
 def apply_constraints():
     with driver.session() as s:
         for c in CONSTRAINTS:
@@ -93,10 +157,13 @@ def ensure_qdrant_collection(dim: int):
 
 
 # --- Import logic for your ALM schema ---
-def import_requirements(reqs: List[Dict[str, Any]]):
+def import_requirements(
+    reqs: List[Dict[str, Any]], label_index: Optional[Dict[Any, Set[str]]] = None
+):
     with driver.session() as s:
         for r in reqs:
             req_id = r.get("id")
+            remember_label(label_index, req_id, "Requirement")
             # ingest all properties into props
             run_cypher(
                 s,
@@ -110,6 +177,7 @@ def import_requirements(reqs: List[Dict[str, Any]]):
             # ReqDocNo link
             reqdocno = r.get("ReqDocNo")
             if reqdocno:
+                remember_label(label_index, reqdocno, "ReqDoc")
                 run_cypher(
                     s,
                     """
@@ -126,6 +194,7 @@ def import_requirements(reqs: List[Dict[str, Any]]):
             else:
                 docno = None
             if docno:
+                remember_label(label_index, docno, "ReqDoc")
                 run_cypher(
                     s,
                     """
@@ -145,6 +214,7 @@ def import_requirements(reqs: List[Dict[str, Any]]):
                     else:
                         cust_id = str(cust)
                         cust_name = None
+                    remember_label(label_index, cust_id, "Customer")
                     run_cypher(
                         s,
                         """
@@ -162,6 +232,7 @@ def import_requirements(reqs: List[Dict[str, Any]]):
                 if cust_reqs and p in cust_reqs:
                     # treat as CustomerRequirement
                     custreq_id = p
+                    remember_label(label_index, custreq_id, "CustomerRequirement")
                     run_cypher(
                         s,
                         """
@@ -187,6 +258,7 @@ def import_requirements(reqs: List[Dict[str, Any]]):
                 srd_no = srd_item.get("no")
                 # link to ReqDoc
                 if srd_no:
+                    remember_label(label_index, srd_no, "ReqDoc")
                     run_cypher(
                         s,
                         """
@@ -197,6 +269,7 @@ def import_requirements(reqs: List[Dict[str, Any]]):
                         {"doc_id": srd_no, "req_id": req_id},
                     )
                 # ingest srd_item as Srd node
+                remember_label(label_index, srd_no or f"{req_id}-srd-unknown", "Srd")
                 run_cypher(
                     s,
                     """
@@ -212,10 +285,13 @@ def import_requirements(reqs: List[Dict[str, Any]]):
                 )
 
 
-def import_testcases(tcs: List[Dict[str, Any]]):
+def import_testcases(
+    tcs: List[Dict[str, Any]], label_index: Optional[Dict[Any, Set[str]]] = None
+):
     with driver.session() as s:
         for tc in tcs:
             tc_id = tc.get("id")
+            remember_label(label_index, tc_id, "TestCase")
             run_cypher(
                 s,
                 """
@@ -237,10 +313,13 @@ def import_testcases(tcs: List[Dict[str, Any]]):
                     )
 
 
-def import_testruns(runs: List[Dict[str, Any]]):
+def import_testruns(
+    runs: List[Dict[str, Any]], label_index: Optional[Dict[Any, Set[str]]] = None
+):
     with driver.session() as s:
         for tr in runs:
             tr_id = tr.get("id")
+            remember_label(label_index, tr_id, "TestRun")
             run_cypher(
                 s,
                 """
@@ -262,22 +341,119 @@ def import_testruns(runs: List[Dict[str, Any]]):
                 )
 
 
-def import_generic_links(links: List[Dict[str, Any]]):
+def lookup_labels(session: Session, ids: List[Any]) -> Dict[Any, Set[str]]:
+    """
+    Resolve ids not seen during this import, one indexed lookup per label. An
+    id may exist under several labels (e.g. an SRD number is both a ReqDoc and
+    an Srd id), so every matching label is kept.
+    """
+    found: Dict[Any, Set[str]] = {}
+    for label in NODE_LABELS:
+        recs = session.run(
+            f"MATCH (n:{label}) WHERE n.id IN $ids RETURN n.id AS id",
+            {"ids": ids},
+        ).data()
+        for rec in recs:
+            found.setdefault(rec["id"], set()).add(label)
+    return found
+
+
+def import_generic_links(
+    links: List[Dict[str, Any]],
+    label_index: Optional[Dict[Any, Set[str]]] = None,
+    match_unlabeled: Optional[bool] = None,
+) -> List[Any]:
+    """
+    Merge generic links in batches grouped by (source label, target label,
+    linkType). Labels come from the optional sourceLabel/targetLabel hints on
+    each link, then the ids gathered during this import, then the graph, so
+    every MATCH can use the unique-constraint index. An endpoint known under
+    several labels is linked under each of them. Hinted and graph-resolved
+    labels are added to label_index. Endpoints whose label stays unknown are
+    returned, and their links are skipped unless match_unlabeled (default
+    LINK_MATCH_UNLABELED) is set.
+    """
+    if label_index is None:
+        label_index = {}
+    if match_unlabeled is None:
+        match_unlabeled = LINK_MATCH_UNLABELED
+    valid: List[Tuple[Any, Any, str, Optional[str], Optional[str]]] = []
+    for ln in links:
+        source = ln.get("sourceId")
+        target = ln.get("targetId")
+        ltype = ln.get("linkType") or "LINKS_TO"
+        if not (source and target):
+            continue
+        if not REL_TYPE_PATTERN.match(str(ltype)):
+            logger.warning(
+                f"Skipping link {source}->{target}: invalid linkType {ltype!r}"
+            )
+            continue
+        hints = []
+        for hint in (ln.get("sourceLabel"), ln.get("targetLabel")):
+            if hint and hint not in NODE_LABELS:
+                logger.warning(f"Ignoring unknown label hint {hint!r}")
+                hint = None
+            hints.append(hint)
+        valid.append((source, target, ltype, hints[0], hints[1]))
+        for node_id, hint in ((source, hints[0]), (target, hints[1])):
+            if hint:
+                remember_label(label_index, node_id, hint)
+
     with driver.session() as s:
-        for ln in links:
-            source = ln.get("sourceId")
-            target = ln.get("targetId")
-            ltype = ln.get("linkType", "LINKS_TO")
-            if source and target:
-                run_cypher(
-                    s,
-                    f"""
-                    MATCH (src {{id:$source}})
-                    MATCH (tgt {{id:$target}})
-                    MERGE (src)-[:{ltype}]->(tgt)
-                    """,
-                    {"source": source, "target": target},
-                )
+        # dict keys keep first-seen order with O(1) membership
+        pending: Dict[Any, None] = {}
+        for src, tgt, _, _, _ in valid:
+            for node_id in (src, tgt):
+                if node_id not in label_index:
+                    pending[node_id] = None
+        if pending:
+            for node_id, labels in lookup_labels(s, list(pending)).items():
+                label_index.setdefault(node_id, set()).update(labels)
+        unresolved = [node_id for node_id in pending if node_id not in label_index]
+
+        groups: Dict[Tuple[Any, Any, str], List[Dict[str, Any]]] = defaultdict(list)
+        for src, tgt, ltype, src_hint, tgt_hint in valid:
+            src_labels = [src_hint] if src_hint else sorted(label_index.get(src, ()))
+            tgt_labels = [tgt_hint] if tgt_hint else sorted(label_index.get(tgt, ()))
+            for src_label in src_labels or [None]:
+                for tgt_label in tgt_labels or [None]:
+                    groups[(src_label, tgt_label, ltype)].append(
+                        {"source": src, "target": tgt}
+                    )
+
+        skipped = 0
+        for (src_label, tgt_label, ltype), rows in groups.items():
+            if not (src_label and tgt_label) and not match_unlabeled:
+                skipped += len(rows)
+                continue
+            # label-less matches must never reach internal nodes such as :Meta
+            src_match = (
+                f"(src:{src_label} {{id:row.source}})"
+                if src_label
+                else "(src {id:row.source}) WHERE NOT src:Meta"
+            )
+            tgt_match = (
+                f"(tgt:{tgt_label} {{id:row.target}})"
+                if tgt_label
+                else "(tgt {id:row.target}) WHERE NOT tgt:Meta"
+            )
+            query = f"""
+                UNWIND $rows AS row
+                MATCH {src_match}
+                MATCH {tgt_match}
+                MERGE (src)-[:{ltype}]->(tgt)
+                """
+            for batch in chunked(rows, LINK_BATCH_SIZE):
+                run_cypher(s, query, {"rows": batch})
+
+    if skipped:
+        logger.warning(
+            f"Skipped {skipped} link(s): {len(unresolved)} endpoint id(s) match "
+            "no Requirement, ReqDoc, TestCase, TestRun, Customer, "
+            "CustomerRequirement or Srd node"
+        )
+    return unresolved
 
 
 def export_for_embeddings() -> List[Dict[str, Any]]:
@@ -323,15 +499,354 @@ def sync_qdrant():
     return len(points)
 
 
+# --- Coverage aggregates ---
+REQUIREMENT_COVERAGE_QUERY = """
+UNWIND $ids AS rid
+MATCH (r:Requirement {id:rid})
+OPTIONAL MATCH (r)-[:VERIFIED_BY]->(tc:TestCase)
+OPTIONAL MATCH (tc)-[:EXECUTED_IN]->(tr:TestRun)
+WITH r, count(DISTINCT tc) AS tcCount, collect(DISTINCT tr) AS runs
+UNWIND (CASE WHEN size(runs) = 0 THEN [null] ELSE runs END) AS run
+WITH r, tcCount, runs, run
+ORDER BY run[$ts] IS NULL, run[$ts] DESC, run.id DESC
+WITH r, tcCount, runs, collect(run)[0] AS latest
+WITH r, tcCount, size(runs) AS runCount, latest.status AS latestStatus,
+     size([x IN runs WHERE toLower(toString(coalesce(x.status, ''))) IN $pass]) AS passCount,
+     size([x IN runs WHERE toLower(toString(coalesce(x.status, ''))) IN $fail]) AS failCount
+SET r.coverageTestCaseCount = tcCount,
+    r.coverageRunCount = runCount,
+    r.coverageLatestStatus = latestStatus,
+    r.coveragePassCount = passCount,
+    r.coverageFailCount = failCount,
+    r.coverageStatus = CASE
+        WHEN tcCount = 0 THEN 'untested'
+        WHEN runCount = 0 THEN 'not_run'
+        WHEN toLower(toString(coalesce(latestStatus, ''))) IN $pass THEN 'passed'
+        WHEN toLower(toString(coalesce(latestStatus, ''))) IN $fail THEN 'failed'
+        ELSE 'other'
+    END
+"""
+
+ROLLUP_COVERAGE_TEMPLATE = """
+UNWIND $ids AS oid
+MATCH (o:{label} {{id:oid}})
+OPTIONAL MATCH (o){pattern}(r:Requirement)
+WITH o, collect(DISTINCT r) AS reqs
+SET o.coverageRequirementCount = size(reqs),
+    o.coverageUntestedCount = size([x IN reqs WHERE x.coverageStatus = 'untested']),
+    o.coverageNotRunCount = size([x IN reqs WHERE x.coverageStatus = 'not_run']),
+    o.coveragePassedCount = size([x IN reqs WHERE x.coverageStatus = 'passed']),
+    o.coverageFailedCount = size([x IN reqs WHERE x.coverageStatus = 'failed']),
+    o.coverageOtherCount = size([x IN reqs WHERE x.coverageStatus = 'other'])
+"""
+
+# Label and requirement relationship pattern for each rollup level
+COVERAGE_ROLLUPS = {
+    "reqdoc": ("ReqDoc", "-[:CONTAINS|BELONGS_TO_DOC]-"),
+    "customer": ("Customer", "-[:USES_REQUIREMENT]->"),
+}
+
+
+def affected_requirements(
+    session: Session,
+    req_ids: List[Any],
+    tc_ids: List[Any],
+    tr_ids: List[Any],
+) -> List[Any]:
+    affected = set(
+        rec["id"]
+        for rec in session.run(
+            "MATCH (r:Requirement) WHERE r.id IN $ids RETURN r.id AS id",
+            {"ids": req_ids},
+        ).data()
+    )
+    if tc_ids:
+        recs = session.run(
+            """
+            MATCH (r:Requirement)-[:VERIFIED_BY]->(tc:TestCase)
+            WHERE tc.id IN $ids
+            RETURN DISTINCT r.id AS id
+            """,
+            {"ids": tc_ids},
+        ).data()
+        affected.update(rec["id"] for rec in recs)
+    if tr_ids:
+        recs = session.run(
+            """
+            MATCH (r:Requirement)-[:VERIFIED_BY]->(:TestCase)-[:EXECUTED_IN]->(tr:TestRun)
+            WHERE tr.id IN $ids
+            RETURN DISTINCT r.id AS id
+            """,
+            {"ids": tr_ids},
+        ).data()
+        affected.update(rec["id"] for rec in recs)
+    return sorted(affected, key=str)
+
+
+def refresh_coverage(
+    req_ids: Optional[List[Any]] = None,
+    tc_ids: Optional[List[Any]] = None,
+    tr_ids: Optional[List[Any]] = None,
+) -> int:
+    """
+    Recompute coverage aggregates for the requirements reachable from the
+    given ids and roll them up to their ReqDocs and Customers. With no ids at
+    all, every requirement is recomputed.
+    """
+    with driver.session() as s:
+        if req_ids is None and tc_ids is None and tr_ids is None:
+            ids = [
+                rec["id"]
+                for rec in s.run("MATCH (r:Requirement) RETURN r.id AS id").data()
+            ]
+        else:
+            ids = affected_requirements(s, req_ids or [], tc_ids or [], tr_ids or [])
+        if not ids:
+            return 0
+
+        for batch in chunked(ids, COVERAGE_BATCH_SIZE):
+            run_cypher(
+                s,
+                REQUIREMENT_COVERAGE_QUERY,
+                {
+                    "ids": batch,
+                    "ts": RUN_TIMESTAMP_FIELD,
+                    "pass": COVERAGE_PASS_STATUSES,
+                    "fail": COVERAGE_FAIL_STATUSES,
+                },
+            )
+
+        for label, pattern in COVERAGE_ROLLUPS.values():
+            owners = s.run(
+                f"""
+                MATCH (o:{label}){pattern}(r:Requirement)
+                WHERE r.id IN $ids
+                RETURN DISTINCT o.id AS id
+                """,
+                {"ids": ids},
+            ).data()
+            owner_ids = [rec["id"] for rec in owners]
+            query = ROLLUP_COVERAGE_TEMPLATE.format(label=label, pattern=pattern)
+            for batch in chunked(owner_ids, COVERAGE_BATCH_SIZE):
+                run_cypher(s, query, {"ids": batch})
+
+    logger.info(f"Coverage aggregates refreshed for {len(ids)} requirements")
+    return len(ids)
+
+
+def get_coverage(
+    scope: str = "requirement",
+    status: Optional[str] = None,
+    without_pass: bool = False,
+    skip: int = 0,
+    limit: int = 50,
+) -> Dict[str, Any]:
+    """
+    Page through the stored coverage aggregates. status and without_pass only
+    apply to the requirement scope.
+    """
+    if scope not in COVERAGE_SCOPES:
+        raise ValueError(f"Unknown coverage scope: {scope}")
+    if status and status not in COVERAGE_STATUSES:
+        raise ValueError(f"Unknown coverage status: {status}")
+
+    if scope == "requirement":
+        match = "MATCH (n:Requirement) WHERE n.coverageStatus IS NOT NULL"
+        if status:
+            match += " AND n.coverageStatus = $status"
+        if without_pass:
+            match += " AND n.coveragePassCount = 0"
+        fields = """
+            n.id AS id,
+            n.coverageTestCaseCount AS testCaseCount,
+            n.coverageRunCount AS runCount,
+            n.coverageLatestStatus AS latestStatus,
+            n.coveragePassCount AS passCount,
+            n.coverageFailCount AS failCount,
+            n.coverageStatus AS status
+        """
+    else:
+        label = COVERAGE_ROLLUPS[scope][0]
+        match = f"MATCH (n:{label}) WHERE n.coverageRequirementCount IS NOT NULL"
+        fields = """
+            n.id AS id,
+            n.coverageRequirementCount AS requirementCount,
+            n.coverageUntestedCount AS untestedCount,
+            n.coverageNotRunCount AS notRunCount,
+            n.coveragePassedCount AS passedCount,
+            n.coverageFailedCount AS failedCount,
+            n.coverageOtherCount AS otherCount
+        """
+
+    params = {"status": status, "skip": max(skip, 0), "limit": max(limit, 0)}
+    with driver.session() as s:
+        total = s.run(f"{match} RETURN count(n) AS total", params).single()["total"]
+        items = s.run(
+            f"{match} RETURN {fields} ORDER BY n.id SKIP $skip LIMIT $limit",
+            params,
+        ).data()
+    return {
+        "scope": scope,
+        "total": total,
+        "skip": params["skip"],
+        "limit": params["limit"],
+        "items": items,
+    }
+
+
+# --- Answer cache ---
+# (epoch, counter) read from the Meta node; the epoch changes when the node is
+# recreated, so a counter reset is never mistaken for an older generation
+DataGeneration = Tuple[str, int]
+
+
+class AnswerCache:
+    """
+    LRU cache of /ask answers. A question is served from the cache when an
+    earlier one retrieved exactly the same artifacts and its query embedding
+    has cosine similarity >= threshold. Entries belong to one data generation.
+    The cache only moves forward: a newer generation (or a new epoch) drops
+    all entries, while callers still holding an older generation miss and
+    cannot store.
+    """
+
+    def __init__(self, max_size: int, threshold: float):
+        self.max_size = max_size
+        self.threshold = threshold
+        self.epoch = ""
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Tuple[Any, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(vec: List[float]) -> List[float]:
+        norm = math.sqrt(sum(x * x for x in vec)) or 1.0
+        return [x / norm for x in vec]
+
+    def _advance(self, generation: DataGeneration) -> bool:
+        """Move to generation if it is newer; return whether it is current."""
+        epoch, counter = generation
+        if epoch != self.epoch or counter > self.generation:
+            self._entries.clear()
+            self.epoch, self.generation = epoch, counter
+        return counter == self.generation
+
+    def lookup(
+        self, vec: List[float], retrieved: frozenset, generation: DataGeneration
+    ) -> Optional[str]:
+        if self.max_size <= 0:
+            return None
+        unit = self._normalize(vec)
+        with self._lock:
+            if not self._advance(generation):
+                # read before an import finished; leave the newer entries alone
+                self.misses += 1
+                return None
+            best_key, best_score = None, self.threshold
+            for key, entry in self._entries.items():
+                if key[0] != retrieved:
+                    continue
+                score = sum(a * b for a, b in zip(unit, entry["vector"]))
+                if score >= best_score:
+                    best_key, best_score = key, score
+            if best_key is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(best_key)
+            self.hits += 1
+            return self._entries[best_key]["answer"]
+
+    def store(
+        self,
+        query: str,
+        vec: List[float],
+        retrieved: frozenset,
+        answer: str,
+        generation: DataGeneration,
+    ) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            if not self._advance(generation):
+                # an import finished while this answer was being generated
+                return
+            key = (retrieved, query.strip().lower())
+            self._entries[key] = {"vector": self._normalize(vec), "answer": answer}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "epoch": self.epoch,
+                "generation": self.generation,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "threshold": self.threshold,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+answer_cache = AnswerCache(ANSWER_CACHE_SIZE, ANSWER_CACHE_THRESHOLD)
+
+
+# The data generation lives in Neo4j so imports from the CLI or another
+# worker also invalidate cached answers in every server process
+def current_data_generation() -> DataGeneration:
+    with driver.session() as s:
+        rec = s.run(
+            "MATCH (m:Meta {id:'data'}) "
+            "RETURN m.epoch AS epoch, m.generation AS generation"
+        ).single()
+    if not rec:
+        return ("", 0)
+    return (rec["epoch"] or "", rec["generation"] or 0)
+
+
+def bump_data_generation() -> DataGeneration:
+    with driver.session() as s:
+        rec = s.run("""
+            MERGE (m:Meta {id:'data'})
+            SET m.epoch = coalesce(m.epoch, randomUUID()),
+                m.generation = coalesce(m.generation, 0) + 1
+            RETURN m.epoch AS epoch, m.generation AS generation
+            """).single()
+    return (rec["epoch"], rec["generation"])
+
+
 def import_from_json(data: Dict[str, Any]):
+    try:
+        _import_from_json(data)
+    finally:
+        # bump even on failure: Neo4j may already hold part of the new data
+        bump_data_generation()
+
+
+def _import_from_json(data: Dict[str, Any]):
+    label_index: Dict[Any, Set[str]] = {}
     if "requirements" in data:
-        import_requirements(data["requirements"])
+        import_requirements(data["requirements"], label_index)
     if "testCases" in data:
-        import_testcases(data["testCases"])
+        import_testcases(data["testCases"], label_index)
     if "testRuns" in data:
-        import_testruns(data["testRuns"])
+        import_testruns(data["testRuns"], label_index)
     if "links" in data:
-        import_generic_links(data["links"])
+        import_generic_links(data["links"], label_index)
+    # Refresh coverage for the touched subgraph only
+    touched: Dict[str, List[Any]] = defaultdict(list)
+    for node_id, labels in label_index.items():
+        for label in labels:
+            touched[label].append(node_id)
+    refresh_coverage(touched["Requirement"], touched["TestCase"], touched["TestRun"])
     # Sync embeddings afterwards
     synced = sync_qdrant()
     logger.info(f"Embeddings sync complete: {synced} vectors indexed.")
@@ -353,8 +868,9 @@ def vector_search(query: str) -> List[Dict[str, Any]]:
     ]
 
 
-def hybrid_search(query: str) -> Dict[str, Any]:
-    vec = embed_texts([query])[0]
+def hybrid_search(query: str, vec: Optional[List[float]] = None) -> Dict[str, Any]:
+    if vec is None:
+        vec = embed_texts([query])[0]
     results = qdrant.search(
         collection_name=QDRANT_COLLECTION, query_vector=vec, limit=5
     )
@@ -434,7 +950,19 @@ def hybrid_search(query: str) -> Dict[str, Any]:
 
 
 def ask(query: str) -> Dict[str, Any]:
-    hybrid = hybrid_search(query)
+    generation = current_data_generation()
+    vec = embed_texts([query])[0]
+    hybrid = hybrid_search(query, vec)
+    retrieved = frozenset((m["type"], m["id"]) for m in hybrid["vector_matches"])
+    cached = answer_cache.lookup(vec, retrieved, generation)
+    if cached is not None:
+        return {
+            "query": query,
+            "data_used": hybrid["graph_neighbourhood"],
+            "answer": cached,
+            "cached": True,
+        }
+
     context = json.dumps(hybrid["graph_neighbourhood"], indent=2)
     system_prompt = (
         "You are a traceability assistant. You receive a question and data about requirements, test cases, test runs, customers, documents.\n"
@@ -454,10 +982,12 @@ def ask(query: str) -> Dict[str, Any]:
     )
     resp.raise_for_status()
     answer = resp.json().get("message", {}).get("content", "")
+    answer_cache.store(query, vec, retrieved, answer, generation)
     return {
         "query": query,
         "data_used": hybrid["graph_neighbourhood"],
         "answer": answer,
+        "cached": False,
     }
 
 
@@ -486,10 +1016,63 @@ def ask_endpoint(q: str):
     return ask(q)
 
 
+@app.get("/ask/cache")
+def ask_cache_endpoint():
+    return answer_cache.stats()
+
+
+@app.get("/coverage")
+def coverage_endpoint(
+    scope: str = "requirement",
+    status: Optional[str] = None,
+    without_pass: bool = False,
+    skip: int = 0,
+    limit: int = 50,
+):
+    try:
+        return get_coverage(scope, status, without_pass, skip, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def coverage_cli(argv: List[str]):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="ai_hybrid_app_import_sync.py coverage",
+        description="Show precomputed traceability coverage aggregates.",
+    )
+    parser.add_argument(
+        "scope", nargs="?", default="requirement", choices=COVERAGE_SCOPES
+    )
+    parser.add_argument("--status", choices=COVERAGE_STATUSES)
+    parser.add_argument(
+        "--without-pass",
+        action="store_true",
+        help="Only requirements with no passing run.",
+    )
+    parser.add_argument("--skip", type=int, default=0)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Recompute aggregates for the whole graph first.",
+    )
+    args = parser.parse_args(argv)
+    if args.refresh:
+        refresh_coverage()
+    result = get_coverage(
+        args.scope, args.status, args.without_pass, args.skip, args.limit
+    )
+    print(json.dumps(result, indent=2, default=str))
+
+
 def main():
     import sys
 
-    if len(sys.argv) == 2:
+    if len(sys.argv) >= 2 and sys.argv[1] == "coverage":
+        coverage_cli(sys.argv[2:])
+    elif len(sys.argv) == 2:
         json_path = sys.argv[1]
         if not os.path.isfile(json_path):
             print(f"File not found: {json_path}")
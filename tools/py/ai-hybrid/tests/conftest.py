@@ -0,0 +1,56 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import ai_hybrid_app_import_sync as core  # noqa: E402
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def data(self):
+        return self.rows
+
+    def single(self):
+        return self.rows[0] if self.rows else None
+
+
+class FakeSession:
+    """Records every statement; answers reads through a responder callback."""
+
+    def __init__(self, responder=None):
+        self.calls = []
+        self.responder = responder or (lambda query, params: [])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def run(self, query, params=None):
+        params = params or {}
+        self.calls.append((" ".join(query.split()), params))
+        return FakeResult(self.responder(query, params))
+
+
+class FakeDriver:
+    def __init__(self, session):
+        self._session = session
+
+    def session(self):
+        return self._session
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    def install(responder=None):
+        session = FakeSession(responder)
+        monkeypatch.setattr(core, "driver", FakeDriver(session))
+        return session
+
+    return install
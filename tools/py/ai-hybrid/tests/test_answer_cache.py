@@ -0,0 +1,120 @@
+import ai_hybrid_app_import_sync as core
+import pytest
+
+IDS = frozenset({("Requirement", "REQ-12")})
+
+
+G0 = ("epoch-a", 0)
+G1 = ("epoch-a", 1)
+
+
+def test_similar_query_with_same_retrieval_hits():
+    cache = core.AnswerCache(max_size=4, threshold=0.9)
+    assert cache.lookup([1.0, 0.0, 0.1], IDS, G0) is None
+    cache.store("is REQ-12 tested?", [1.0, 0.0, 0.1], IDS, "yes", G0)
+    assert cache.lookup([1.0, 0.05, 0.1], IDS, G0) == "yes"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+
+def test_dissimilar_query_or_other_retrieval_misses():
+    cache = core.AnswerCache(max_size=4, threshold=0.9)
+    cache.store("is REQ-12 tested?", [1.0, 0.0, 0.0], IDS, "yes", G0)
+    assert cache.lookup([0.0, 1.0, 0.0], IDS, G0) is None
+    assert cache.lookup([1.0, 0.0, 0.0], frozenset(), G0) is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = core.AnswerCache(max_size=2, threshold=0.99)
+    cache.store("a", [1.0, 0.0, 0.0], IDS, "a", G0)
+    cache.store("b", [0.0, 1.0, 0.0], IDS, "b", G0)
+    assert cache.lookup([1.0, 0.0, 0.0], IDS, G0) == "a"
+    cache.store("c", [0.0, 0.0, 1.0], IDS, "c", G0)
+    assert cache.lookup([0.0, 1.0, 0.0], IDS, G0) is None
+    assert cache.lookup([1.0, 0.0, 0.0], IDS, G0) == "a"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_newer_generation_drops_entries():
+    cache = core.AnswerCache(max_size=4, threshold=0.9)
+    cache.store("q", [1.0, 0.0], IDS, "old", G0)
+    assert cache.lookup([1.0, 0.0], IDS, G1) is None
+    assert cache.stats()["size"] == 0
+
+
+def test_old_generation_requests_do_not_roll_the_cache_back():
+    cache = core.AnswerCache(max_size=4, threshold=0.9)
+    cache.store("q", [1.0, 0.0], IDS, "new", G1)
+    # a slow /ask that read the generation before the import finished
+    assert cache.lookup([1.0, 0.0], IDS, G0) is None
+    cache.store("q", [1.0, 0.0], IDS, "stale", G0)
+    assert cache.lookup([1.0, 0.0], IDS, G1) == "new"
+    stats = cache.stats()
+    assert (stats["generation"], stats["size"]) == (1, 1)
+
+
+def test_counter_reset_under_new_epoch_starts_over():
+    cache = core.AnswerCache(max_size=4, threshold=0.9)
+    cache.store("q", [1.0, 0.0], IDS, "old", ("epoch-a", 5))
+    assert cache.lookup([1.0, 0.0], IDS, ("epoch-b", 1)) is None
+    cache.store("q", [1.0, 0.0], IDS, "fresh", ("epoch-b", 1))
+    assert cache.lookup([1.0, 0.0], IDS, ("epoch-b", 1)) == "fresh"
+    assert cache.stats()["epoch"] == "epoch-b"
+
+
+def test_zero_size_disables_cache():
+    cache = core.AnswerCache(max_size=0, threshold=0.0)
+    cache.store("q", [1.0], IDS, "a", G0)
+    assert cache.lookup([1.0], IDS, G0) is None
+
+
+def test_import_bumps_generation_even_when_it_fails(monkeypatch):
+    bumps = []
+
+    def fail(*args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(core, "import_requirements", fail)
+    monkeypatch.setattr(core, "bump_data_generation", lambda: bumps.append(1))
+    with pytest.raises(RuntimeError):
+        core.import_from_json({"requirements": [{"id": "R1"}]})
+    assert bumps == [1]
+
+
+def test_data_generation_defaults_before_first_import(fake_session):
+    fake_session()
+    assert core.current_data_generation() == ("", 0)
+
+
+def test_repeated_question_skips_the_llm(fake_session, monkeypatch):
+    fake_session(lambda query, params: [{"epoch": "e", "generation": 7}])
+    monkeypatch.setattr(core, "answer_cache", core.AnswerCache(8, 0.95))
+    monkeypatch.setattr(core, "embed_texts", lambda texts: [[1.0, 0.0]])
+    monkeypatch.setattr(
+        core,
+        "hybrid_search",
+        lambda query, vec=None: {
+            "vector_matches": [{"id": "REQ-12", "type": "Requirement", "score": 1}],
+            "graph_neighbourhood": {},
+        },
+    )
+    chats = []
+
+    class Reply:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"message": {"content": "yes"}}
+
+    def post(*args, **kwargs):
+        chats.append(kwargs)
+        return Reply()
+
+    monkeypatch.setattr(core.requests, "post", post)
+    first = core.ask("is REQ-12 tested?")
+    second = core.ask("what tests verify REQ-12?")
+    assert (first["cached"], second["cached"]) == (False, True)
+    assert second["answer"] == "yes"
+    assert len(chats) == 1
+    assert core.answer_cache.stats()["generation"] == 7
@@ -0,0 +1,106 @@
+import ai_hybrid_app
+import ai_hybrid_app_import_sync as core
+import pytest
+from fastapi.testclient import TestClient
+
+
+def test_get_coverage_rejects_unknown_scope_and_status(fake_session):
+    fake_session()
+    with pytest.raises(ValueError):
+        core.get_coverage(scope="project")
+    with pytest.raises(ValueError):
+        core.get_coverage(status="green")
+
+
+def test_get_coverage_pages_requirements(fake_session):
+    def responder(query, params):
+        if "count(n) AS total" in query:
+            return [{"total": 1}]
+        return [{"id": "R1", "status": "untested"}]
+
+    session = fake_session(responder)
+    result = core.get_coverage(status="untested", without_pass=True, skip=-3, limit=10)
+    assert result == {
+        "scope": "requirement",
+        "total": 1,
+        "skip": 0,
+        "limit": 10,
+        "items": [{"id": "R1", "status": "untested"}],
+    }
+    query, params = session.calls[-1]
+    assert "n.coverageStatus = $status" in query
+    assert "n.coveragePassCount = 0" in query
+    assert "ORDER BY n.id SKIP $skip LIMIT $limit" in query
+    assert params["status"] == "untested"
+
+
+def coverage_responder(query, params):
+    if "RETURN r.id AS id" in query:
+        return [{"id": i} for i in params["ids"]]
+    if "RETURN DISTINCT o.id AS id" in query:
+        return [{"id": "D1"}, {"id": "D2"}, {"id": "D3"}]
+    return []
+
+
+def test_refresh_coverage_batches_requirements(fake_session, monkeypatch):
+    monkeypatch.setattr(core, "COVERAGE_BATCH_SIZE", 2)
+    session = fake_session(coverage_responder)
+    assert core.refresh_coverage(["R1", "R2", "R3"], [], []) == 3
+
+    writes = [p for _, p in session.calls if "ts" in p]
+    assert [p["ids"] for p in writes] == [["R1", "R2"], ["R3"]]
+    for params in writes:
+        assert params["ts"] == core.RUN_TIMESTAMP_FIELD
+        assert params["pass"] == core.COVERAGE_PASS_STATUSES
+        assert params["fail"] == core.COVERAGE_FAIL_STATUSES
+
+
+def test_refresh_coverage_rolls_up_owners_of_affected_requirements(
+    fake_session, monkeypatch
+):
+    monkeypatch.setattr(core, "COVERAGE_BATCH_SIZE", 2)
+    session = fake_session(coverage_responder)
+    core.refresh_coverage(["R1"], [], [])
+
+    owner_lookups = [p for _, p in session.calls if p == {"ids": ["R1"]}]
+    # affected requirements, then ReqDoc and Customer owners
+    assert len(owner_lookups) == 1 + len(core.COVERAGE_ROLLUPS)
+    owners = {"D1", "D2", "D3"}
+    rollups = [
+        p["ids"] for _, p in session.calls if p.get("ids") and set(p["ids"]) <= owners
+    ]
+    assert rollups == [["D1", "D2"], ["D3"]] * len(core.COVERAGE_ROLLUPS)
+
+
+def test_refresh_coverage_without_affected_requirements_writes_nothing(fake_session):
+    session = fake_session()
+    assert core.refresh_coverage(["R404"], [], []) == 0
+    assert len(session.calls) == 1
+
+
+def test_hinted_link_endpoints_are_recorded(fake_session):
+    fake_session()
+    label_index = {}
+    unlabeled = core.import_generic_links(
+        [
+            {
+                "sourceId": "REQ-1",
+                "sourceLabel": "Requirement",
+                "targetId": "TC-9",
+                "targetLabel": "TestCase",
+                "linkType": "VERIFIED_BY",
+            },
+            {"sourceId": "X", "targetId": "TC-9"},
+        ],
+        label_index,
+    )
+    assert label_index == {"REQ-1": {"Requirement"}, "TC-9": {"TestCase"}}
+    assert unlabeled == ["X"]
+
+
+@pytest.mark.parametrize("app", [core.app, ai_hybrid_app.app])
+def test_coverage_endpoint_maps_bad_arguments_to_400(fake_session, app):
+    fake_session()
+    client = TestClient(app)
+    assert client.get("/coverage", params={"scope": "project"}).status_code == 400
+    assert client.get("/coverage", params={"status": "green"}).status_code == 400
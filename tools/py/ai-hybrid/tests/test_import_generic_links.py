@@ -0,0 +1,140 @@
+import time
+
+import ai_hybrid_app_import_sync as core
+
+
+def merge_calls(session):
+    return [(q, p) for q, p in session.calls if q.startswith("UNWIND $rows")]
+
+
+def test_links_are_batched_per_label_pair_and_type(fake_session):
+    session = fake_session()
+    label_index = {"R1": {"Requirement"}, "R2": {"Requirement"}, "T1": {"TestCase"}}
+    core.import_generic_links(
+        [
+            {"sourceId": "R1", "targetId": "T1", "linkType": "TRACES"},
+            {"sourceId": "R2", "targetId": "T1", "linkType": "TRACES"},
+            {"sourceId": "R1", "targetId": "R2"},
+        ],
+        label_index,
+    )
+    merges = merge_calls(session)
+    assert len(merges) == 2
+    query, params = merges[0]
+    assert "MATCH (src:Requirement {id:row.source})" in query
+    assert "MATCH (tgt:TestCase {id:row.target})" in query
+    assert "MERGE (src)-[:TRACES]->(tgt)" in query
+    assert params["rows"] == [
+        {"source": "R1", "target": "T1"},
+        {"source": "R2", "target": "T1"},
+    ]
+    assert "MERGE (src)-[:LINKS_TO]->(tgt)" in merges[1][0]
+
+
+def test_invalid_link_type_is_skipped(fake_session):
+    session = fake_session()
+    core.import_generic_links(
+        [{"sourceId": "R1", "targetId": "T1", "linkType": "X]->() DETACH DELETE"}],
+        {"R1": {"Requirement"}, "T1": {"TestCase"}},
+    )
+    assert merge_calls(session) == []
+
+
+def test_hints_win_and_unknown_hints_are_ignored(fake_session):
+    session = fake_session()
+    core.import_generic_links(
+        [
+            {
+                "sourceId": "R1",
+                "sourceLabel": "Requirement",
+                "targetId": "S1",
+                "targetLabel": "Bogus",
+            }
+        ],
+        {"S1": {"Srd"}},
+    )
+    ((query, _),) = merge_calls(session)
+    assert "(src:Requirement" in query
+    assert "(tgt:Srd" in query
+
+
+def test_ambiguous_ids_are_linked_under_every_label(fake_session):
+    def responder(query, params):
+        if "MATCH (n:ReqDoc)" in query or "MATCH (n:Srd)" in query:
+            return [{"id": "SRD-1"}]
+        if "MATCH (n:Requirement)" in query:
+            return [{"id": "R1"}]
+        return []
+
+    session = fake_session(responder)
+    core.import_generic_links([{"sourceId": "R1", "targetId": "SRD-1"}], {})
+    targets = sorted(
+        q.split("MATCH (tgt:")[1].split(" ")[0] for q, _ in merge_calls(session)
+    )
+    assert targets == ["ReqDoc", "Srd"]
+
+
+def test_ids_keep_their_raw_type(fake_session):
+    def responder(query, params):
+        return [{"id": 7}] if "MATCH (n:TestRun)" in query else []
+
+    session = fake_session(responder)
+    label_index = {}
+    core.import_generic_links(
+        [{"sourceId": 7, "targetId": "R1", "targetLabel": "Requirement"}],
+        label_index,
+    )
+    lookups = [p for q, p in session.calls if "RETURN n.id AS id" in q]
+    assert lookups[0]["ids"] == [7]
+    ((_, params),) = merge_calls(session)
+    assert params["rows"] == [{"source": 7, "target": "R1"}]
+    assert label_index[7] == {"TestRun"}
+
+
+def test_unknown_endpoints_are_skipped_and_returned(fake_session):
+    session = fake_session()
+    unresolved = core.import_generic_links(
+        [
+            {"sourceId": "A", "targetId": "data"},
+            {"sourceId": "R1", "targetId": "A"},
+        ],
+        {"R1": {"Requirement"}},
+    )
+    assert unresolved == ["A", "data"]
+    assert merge_calls(session) == []
+
+
+def test_unlabeled_matching_is_opt_in_and_never_hits_meta(fake_session):
+    session = fake_session()
+    core.import_generic_links(
+        [{"sourceId": "A", "targetId": "B"}], {}, match_unlabeled=True
+    )
+    ((query, _),) = merge_calls(session)
+    assert "MATCH (src {id:row.source}) WHERE NOT src:Meta" in query
+    assert "MATCH (tgt {id:row.target}) WHERE NOT tgt:Meta" in query
+
+
+def test_many_new_ids_resolve_in_linear_time(fake_session):
+    def responder(query, params):
+        if "MATCH (n:Requirement)" in query:
+            return [{"id": i} for i in params["ids"] if i.startswith("R")]
+        if "MATCH (n:TestCase)" in query:
+            return [{"id": i} for i in params["ids"] if i.startswith("T")]
+        return []
+
+    session = fake_session(responder)
+    n = 30_000
+    links = [{"sourceId": f"R{i}", "targetId": f"T{i}"} for i in range(n)]
+    start = time.perf_counter()
+    unresolved = core.import_generic_links(links, {})
+    elapsed = time.perf_counter() - start
+
+    assert unresolved == []
+    lookups = [p for q, p in session.calls if "RETURN n.id AS id" in q]
+    assert len(lookups) == len(core.NODE_LABELS)
+    assert len(lookups[0]["ids"]) == 2 * n
+    merges = merge_calls(session)
+    assert len(merges) == n // core.LINK_BATCH_SIZE
+    assert sum(len(p["rows"]) for _, p in merges) == n
+    # the old list-based dedup took ~10 s for 20k links
+    assert elapsed < 3